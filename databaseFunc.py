@@ -25,6 +25,14 @@ class DatabaseConnect:
                             created DATE,
                             last DATE,
                             prayerCount INTEGER)''')
+            # day is the primary key so each day's rollover is one indexed lookup
+            self.c.execute('''CREATE TABLE IF NOT EXISTS schedule(
+                            day DATE PRIMARY KEY,
+                            name1 TEXT,
+                            name2 TEXT,
+                            name3 TEXT,
+                            shown TEXT,
+                            cycle TEXT)''')
             self.defaultDate = datetime.date(2000, 1, 1)  # A not prayed for placeholder
 
         except Exception:
@@ -101,21 +109,148 @@ class DatabaseConnect:
     def pick_random_names(self, unprayed_list):
         # Set current Active names to False, pick 3 new names and set them Active
         try:
-            self.c.execute('''UPDATE nameTable SET active = 'False'
-                      WHERE active = 'True' ''')
             tuple_list = random.sample(unprayed_list, 3)
             new_names = []
             for nameTuple in tuple_list:
                 new_names.append(nameTuple[0])
-            for name in new_names:
-                self.c.execute('''UPDATE nameTable SET active = 'True'
-                              WHERE name = ?''', (name,))
+            self.set_active_names(new_names)
             self.conn.commit()
             self.logger.debug('New names picked and made active, Db saved')
             return new_names
         except Exception:
             self.handle_error()
 
+    def set_active_names(self, names):
+        # Set current Active names to False and make the passed names Active
+        self.c.execute('''UPDATE nameTable SET active = 'False'
+                  WHERE active = 'True' ''')
+        for name in names:
+            self.c.execute('''UPDATE nameTable SET active = 'True'
+                          WHERE name = ?''', (name,))
+
+    def draw_schedule(self, pool, all_names, days, start, cycle):
+        # Draw 3 names a day from pool, refilling it from all_names when fewer
+        # than 3 are left. cycle marks the first row: 'Start' if the pool came
+        # from the prayedFor flags, 'Continue' if it carries on an earlier
+        # draw. Refilled days are marked 'Reset' so the flags can be reset
+        # when that day is shown, the same as get_unprayed_list does
+        schedule = []
+        for i in range(days):
+            if len(pool) < 3:
+                pool = all_names.copy()
+                cycle = 'Reset'
+            new_names = random.sample(pool, 3)
+            for name in new_names:
+                pool.remove(name)
+            schedule.append((start + datetime.timedelta(days=i),
+                             new_names[0], new_names[1], new_names[2], cycle))
+            cycle = 'Continue'
+        return schedule
+
+    def get_schedule_pool(self, day):
+        # Returns the names still to be drawn in the schedule's current cycle
+        # before day, or None if no schedule has been generated
+        self.c.execute('''SELECT day, cycle FROM schedule WHERE day < ?
+                        AND cycle != 'Continue' ORDER BY day DESC''', (day,))
+        cycle_start = self.c.fetchone()
+        if cycle_start is None:
+            return None
+        if cycle_start[1] == 'Reset':
+            pool = self.get_all_names()
+        else:
+            self.c.execute('''SELECT name FROM nameTable WHERE prayedFor = 'False' ''')
+            pool = [nameTuple[0] for nameTuple in self.c.fetchall()]
+        self.c.execute('''SELECT name1, name2, name3 FROM schedule
+                        WHERE day >= ? AND day < ?''', (cycle_start[0], day))
+        drawn = set()
+        for row in self.c.fetchall():
+            drawn.update(row)
+        return [name for name in pool if name not in drawn]
+
+    def generate_schedule(self, days, start=None):
+        # Pre-draw 3 names a day for the given number of days from start
+        # (default today), replacing any existing schedule from that day on.
+        # Follows the same rule as get_unprayed_list: names aren't repeated
+        # until fewer than 3 are left, then the whole list is available again.
+        # The currently Active names are left out of the first draws as they
+        # are already on display
+        if start is None:
+            start = datetime.date.today()
+        try:
+            all_names = self.get_all_names()
+            if len(all_names) < 3:
+                logger.info('Less than 3 names in database, no schedule generated')
+                return []
+            self.c.execute('''SELECT name FROM nameTable WHERE prayedFor = 'False'
+                            AND active = 'False' ''')
+            pool = [nameTuple[0] for nameTuple in self.c.fetchall()]
+            schedule = self.draw_schedule(pool, all_names, days, start, 'Start')
+
+            self.c.execute('''DELETE FROM schedule WHERE day >= ?''', (start,))
+            self.c.executemany('''INSERT INTO schedule(day, name1, name2, name3,
+                               cycle, shown) VALUES (?, ?, ?, ?, ?, 'False')''',
+                               schedule)
+            self.conn.commit()
+            logger.debug(str(days) + ' days scheduled from ' + str(start) + ', Db saved')
+            return schedule
+        except Exception:
+            self.handle_error()
+
+    def extend_schedule(self, day):
+        # Once a generated schedule has run out keep the daily rollover going
+        # by drawing day's names from what is left of the schedule's cycle.
+        # Returns False if no schedule has been generated
+        pool = self.get_schedule_pool(day)
+        all_names = self.get_all_names()
+        if pool is None or len(all_names) < 3:
+            return False
+        logger.info('Schedule has ended, drawing new names for ' + str(day))
+        schedule = self.draw_schedule(pool, all_names, 1, day, 'Continue')
+        self.c.executemany('''INSERT INTO schedule(day, name1, name2, name3,
+                           cycle, shown) VALUES (?, ?, ?, ?, ?, 'False')''',
+                           schedule)
+        return True
+
+    def advance_schedule(self, day=None):
+        # Make the names scheduled for day (default today) Active if they
+        # haven't been shown yet. Returns the new names, or None if there was
+        # nothing to change
+        if day is None:
+            day = datetime.date.today()
+        try:
+            self.c.execute('''SELECT name1, name2, name3, shown, cycle FROM schedule
+                            WHERE day = ?''', (day,))
+            data = self.c.fetchone()
+            if data is None:
+                if not self.extend_schedule(day):
+                    return None
+                self.c.execute('''SELECT name1, name2, name3, shown, cycle FROM schedule
+                                WHERE day = ?''', (day,))
+                data = self.c.fetchone()
+            if data[3] == 'True':
+                return None
+            if data[4] == 'Reset':
+                self.reset_names()
+            new_names = list(data[:3])
+            self.set_active_names(new_names)
+            self.c.execute('''UPDATE schedule SET shown = 'True' WHERE day <= ?''',
+                           (day,))
+            self.conn.commit()
+            self.logger.debug('Scheduled names for ' + str(day) + ' made active, Db saved')
+            return new_names
+        except Exception:
+            self.handle_error()
+
+    def export_schedule(self, target_file_path):
+        self.c.execute('''SELECT day, name1, name2, name3 FROM schedule
+                        ORDER BY day''')
+        data = self.c.fetchall()
+        with open(target_file_path, 'w', encoding='UTF-8', newline='') as exportFile:
+            writer = csv.writer(exportFile, delimiter=',',
+                                quoting=csv.QUOTE_ALL)
+            for row in data:
+                writer.writerow(row)
+
     def reset_names(self):
         logger.debug('Names reset')
         try:
@@ -239,6 +374,10 @@ class DatabaseConnect:
             logger.info('Changing ' + name + ' to ' + changed_names[name])
             self.c.execute('''UPDATE nameTable SET name=? WHERE name=?''',
                            (changed_names[name], name))
+            for column in ('name1', 'name2', 'name3'):
+                self.c.execute('''UPDATE schedule SET ''' + column + '''=?
+                               WHERE ''' + column + '''=?''',
+                               (changed_names[name], name))
         self.conn.commit()
 
 
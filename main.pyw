@@ -1,9 +1,11 @@
 import sys
 import os
 import sqlite3
+import datetime
 from PyQt5.QtWidgets import QMainWindow, QApplication, QMessageBox, QFileDialog, QPushButton
 from PyQt5.QtWidgets import QInputDialog, QDialog, QGridLayout, QListWidget, QListWidgetItem
 from PyQt5.QtGui import QIcon
+from PyQt5.QtCore import QTimer
 from databaseFunc import DatabaseConnect
 from prayerUI import *
 from logSettings import createLogger, closeLogging
@@ -11,6 +13,9 @@ from logSettings import createLogger, closeLogging
 logger = createLogger(__name__)
 logger.info('GUI started')
 
+rolloverTime = datetime.time(4, 0)  # Scheduled names change over at this time of day
+scheduleCheckInterval = 60 * 1000  # ms between checks for a schedule rollover
+
 
 class MyApp(QMainWindow):
     def __init__(self):
@@ -19,6 +24,7 @@ class MyApp(QMainWindow):
         self.setWindowIcon(QIcon('logo.png'))
         self.ui.setupUi(self)
         self.db = DatabaseConnect('prayer.db')
+        self.db.advance_schedule(self.scheduleDay())
         self.ui.newNamesButton.clicked.connect(self.newNames)
         self.ui.prayedForAllButton.clicked.connect(self.markAllNames)
         self.startNames = self.db.get_active_names()
@@ -40,6 +46,11 @@ class MyApp(QMainWindow):
         self.ui.actionAdd_new_name.triggered.connect(self.addName)
         self.ui.actionEdit_names.triggered.connect(self.editName)
         self.ui.actionReset_names.triggered.connect(self.resetNames)
+        self.ui.actionGenerate_schedule.triggered.connect(self.generateSchedule)
+        self.ui.actionExport_schedule.triggered.connect(self.exportSchedule)
+        self.scheduleTimer = QTimer(self)
+        self.scheduleTimer.timeout.connect(self.checkSchedule)
+        self.scheduleTimer.start(scheduleCheckInterval)
 
     def errorHandling(self):
         logger.exception('Fatal Error:')
@@ -57,14 +68,53 @@ class MyApp(QMainWindow):
             logger.debug('newNames called')
             newNames = self.db.pick_random_names(self.db.get_unprayed_list())
             logger.debug('new names = ' + str(newNames))
-            self.ui.name1Label.setText(newNames[0])
-            self.ui.name2Label.setText(newNames[1])
-            self.ui.name3Label.setText(newNames[2])
-            labels = [self.ui.name1Label, self.ui.name2Label, self.ui.name3Label]
-            for i in labels:
-                f = i.font()
-                f.setStrikeOut(False)
-                i.setFont(f)
+            self.showNames(newNames)
+        except Exception:
+            self.errorHandling()
+
+    def showNames(self, names):
+        self.ui.name1Label.setText(names[0])
+        self.ui.name2Label.setText(names[1])
+        self.ui.name3Label.setText(names[2])
+        labels = [self.ui.name1Label, self.ui.name2Label, self.ui.name3Label]
+        for i in labels:
+            f = i.font()
+            f.setStrikeOut(False)
+            i.setFont(f)
+
+    def scheduleDay(self):
+        # The schedule day only changes once rolloverTime has passed
+        now = datetime.datetime.now()
+        if now.time() < rolloverTime:
+            return now.date() - datetime.timedelta(days=1)
+        return now.date()
+
+    def checkSchedule(self):
+        try:
+            newNames = self.db.advance_schedule(self.scheduleDay())
+            if newNames:
+                logger.debug('scheduled names = ' + str(newNames))
+                self.showNames(newNames)
+        except Exception:
+            self.errorHandling()
+
+    def generateSchedule(self):
+        logger.debug('generateSchedule called')
+        try:
+            days, ok = QInputDialog.getInt(self, 'Generate schedule',
+                                           'Number of days: ', 30, 1, 3650)
+            if ok:
+                # Start tomorrow so the names on display today are left alone
+                start = self.scheduleDay() + datetime.timedelta(days=1)
+                schedule = self.db.generate_schedule(days, start)
+                if schedule:
+                    QMessageBox.about(self, 'Schedule generated',
+                                      (str(days) + ' days scheduled from ' + str(start) +
+                                       '. Names added later won\'t be scheduled until '
+                                       'the schedule is generated again'))
+                else:
+                    QMessageBox.about(self, 'Schedule not generated',
+                                      'At least 3 names are needed')
         except Exception:
             self.errorHandling()
 
@@ -120,13 +170,25 @@ class MyApp(QMainWindow):
         except Exception:
             self.errorHandling()
 
+    def exportSchedule(self):
+        logger.debug('Export schedule called from GUI')
+        try:
+            file_name, _ = QFileDialog.getSaveFileName(self, 'Export schedule .csv',
+                                                    os.path.expanduser('~\\Documents'),
+                                                    'CSV file (*.csv)')
+            if file_name:
+                self.db.export_schedule(file_name)
+        except Exception:
+            self.errorHandling()
+
     def addName(self):
         logger.debug('addName called')
         try:
             name, ok = QInputDialog.getText(self, 'Add an entry', 'Enter name: ')
             if name and ok:
                 self.db.add_name_to_database(name)
-                QMessageBox.about(self, 'Database updated', (str(name) + ' was added to database'))
+                QMessageBox.about(self, 'Database updated', (str(name) + ' was added to database. '
+                                  'Generate the schedule again to include them'))
                 logger.debug(str(name) + ' added to database')
         except sqlite3.IntegrityError:
             logger.debug('Not unique name error')
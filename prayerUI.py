@@ -97,12 +97,18 @@ class Ui_MainWindow(object):
         self.actionQuit.setObjectName("actionQuit")
         self.actionReset_names = QtWidgets.QAction(MainWindow)
         self.actionReset_names.setObjectName("actionReset_names")
+        self.actionGenerate_schedule = QtWidgets.QAction(MainWindow)
+        self.actionGenerate_schedule.setObjectName("actionGenerate_schedule")
+        self.actionExport_schedule = QtWidgets.QAction(MainWindow)
+        self.actionExport_schedule.setObjectName("actionExport_schedule")
         self.menuFile.addAction(self.actionImport)
         self.menuFile.addAction(self.actionExport)
+        self.menuFile.addAction(self.actionExport_schedule)
         self.menuFile.addAction(self.actionReset_names)
         self.menuFile.addAction(self.actionQuit)
         self.menuEdit.addAction(self.actionAdd_new_name)
         self.menuEdit.addAction(self.actionEdit_names)
+        self.menuEdit.addAction(self.actionGenerate_schedule)
         self.menubar.addAction(self.menuFile.menuAction())
         self.menubar.addAction(self.menuEdit.menuAction())
 
@@ -125,4 +131,6 @@ class Ui_MainWindow(object):
         self.actionEdit_names.setText(_translate("MainWindow", "Edit names"))
         self.actionQuit.setText(_translate("MainWindow", "Quit"))
         self.actionReset_names.setText(_translate("MainWindow", "Reset names"))
+        self.actionGenerate_schedule.setText(_translate("MainWindow", "Generate schedule"))
+        self.actionExport_schedule.setText(_translate("MainWindow", "Export schedule"))
 
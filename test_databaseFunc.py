@@ -2,6 +2,7 @@ import unittest
 import sqlite3
 import databaseFunc
 import os
+import csv
 import datetime
 import logging
 import logSettings
@@ -240,6 +241,149 @@ class TestDatabase(unittest.TestCase):
         self.assertEqual(len(data), 9)
         self.assertEqual(data[-1][0], 'Test person 9')
 
+    def test_generate_schedule(self):
+        schedule = self.db.generate_schedule(5)
+        self.assertEqual(len(schedule), 5)
+        self.assertEqual(schedule[0][0], datetime.date.today())
+        # Test person 1 is already prayed for so can't come up until the reset
+        self.assertNotIn('Test person 1', schedule[0][1:4])
+        self.assertEqual(sorted(schedule[0][1:4]),
+                         ['Test person 2', 'Test person 3', 'Test person 4'])
+        for day in schedule:
+            self.assertEqual(len(set(day[1:4])), 3)
+        self.db.c.execute('''SELECT day, name1, name2, name3, cycle FROM schedule
+                          ORDER BY day''')
+        data = self.db.c.fetchall()
+        self.assertEqual(data, schedule)
+        self.assertEqual(type(data[0][0]), datetime.date)
+        self.assertEqual(schedule[0][4], 'Start')
+        self.assertEqual(schedule[1][4], 'Reset')
+
+        self.db.generate_schedule(2, datetime.date.today() + datetime.timedelta(days=4))
+        self.db.c.execute('''SELECT day FROM schedule''')
+        self.assertEqual(len(self.db.c.fetchall()), 6)
+
+    def test_generate_schedule_no_repeats(self):
+        self.db.add_example_data()
+        self.db.reset_names()
+        schedule = self.db.generate_schedule(2)
+        names = list(schedule[0][1:4]) + list(schedule[1][1:4])
+        self.assertEqual(len(set(names)), 6)
+
+    def test_advance_schedule(self):
+        tomorrow = datetime.date.today() + datetime.timedelta(days=1)
+        self.assertIsNone(self.db.advance_schedule())
+        schedule = self.db.generate_schedule(2)
+        names = self.db.advance_schedule()
+        self.assertEqual(names, list(schedule[0][1:4]))
+        active = [name[0] for name in self.db.get_active_names()]
+        self.assertEqual(sorted(active), sorted(names))
+        self.assertIsNone(self.db.advance_schedule())
+        names = self.db.advance_schedule(tomorrow)
+        self.assertEqual(names, list(schedule[1][1:4]))
+        active = [name[0] for name in self.db.get_active_names()]
+        self.assertEqual(sorted(active), sorted(names))
+
+    def test_advance_schedule_keeps_picked_names(self):
+        schedule = self.db.generate_schedule(2)
+        self.db.advance_schedule()
+        self.db.c.execute('''SELECT shown FROM schedule WHERE day = ?''',
+                          (schedule[1][0],))
+        self.assertEqual(self.db.c.fetchone()[0], 'False')
+        # Names picked with New names survive a restart on the same day
+        picked = self.db.pick_random_names([('Test person 1',), ('Test person 2',),
+                                            ('Test person 3',), ('Test person 4',)])
+        self.assertIsNone(self.db.advance_schedule())
+        active = [name[0] for name in self.db.get_active_names()]
+        self.assertEqual(sorted(active), sorted(picked))
+
+    def test_advance_schedule_marks_earlier_days_shown(self):
+        schedule = self.db.generate_schedule(3)
+        self.db.advance_schedule(schedule[2][0])
+        self.db.c.execute('''SELECT shown FROM schedule''')
+        self.assertEqual(self.db.c.fetchall(), [('True',)] * 3)
+        self.assertIsNone(self.db.advance_schedule(schedule[0][0]))
+
+    def test_advance_schedule_after_schedule_ends(self):
+        schedule = self.db.generate_schedule(1)
+        self.db.advance_schedule()
+        day = schedule[0][0] + datetime.timedelta(days=1)
+        names = self.db.advance_schedule(day)
+        self.assertEqual(len(names), 3)
+        active = [name[0] for name in self.db.get_active_names()]
+        self.assertEqual(sorted(active), sorted(names))
+        self.db.c.execute('''SELECT name1, name2, name3, shown FROM schedule
+                          WHERE day = ?''', (day,))
+        self.assertEqual(self.db.c.fetchone(), (names[0], names[1], names[2], 'True'))
+        self.assertIsNone(self.db.advance_schedule(day))
+
+    def test_generate_schedule_refills_pool(self):
+        all_names = ['Test person 1', 'Test person 2', 'Test person 3', 'Test person 4']
+        second_days = set()
+        for i in range(20):
+            schedule = self.db.generate_schedule(2)
+            self.assertEqual(sorted(schedule[0][1:4]), all_names[1:])
+            self.assertEqual(len(set(schedule[1][1:4])), 3)
+            second_days.update(schedule[1][1:4])
+        # Test person 1 is only available once the pool has been refilled
+        self.assertEqual(sorted(second_days), all_names)
+
+    def test_advance_schedule_resets_names_on_refill(self):
+        schedule = self.db.generate_schedule(2)
+        for name in self.db.advance_schedule():
+            self.db.mark_name_as_prayed(name)
+        self.db.c.execute('''SELECT name FROM nameTable WHERE prayedFor = 'False' ''')
+        self.assertEqual(len(self.db.c.fetchall()), 0)
+        self.db.advance_schedule(schedule[1][0])
+        for name in self.db.get_active_names():
+            self.assertEqual(name[1], 'False')
+
+    def test_extend_schedule_continues_cycle(self):
+        self.db.add_example_data()
+        schedule = self.db.generate_schedule(1)
+        self.db.advance_schedule()
+        day = schedule[0][0] + datetime.timedelta(days=1)
+        names = self.db.advance_schedule(day)
+        for name in names:
+            self.assertNotIn(name, schedule[0][1:4])
+        self.assertNotIn('Test person 1', names)
+        self.db.c.execute('''SELECT cycle FROM schedule WHERE day = ?''', (day,))
+        self.assertEqual(self.db.c.fetchone()[0], 'Continue')
+
+    def test_generate_schedule_skips_active_names(self):
+        self.db.c.execute('''UPDATE nameTable SET active = 'True'
+                          WHERE name = 'Test person 2' ''')
+        self.db.add_example_data()
+        schedule = self.db.generate_schedule(1)
+        self.assertNotIn('Test person 2', schedule[0][1:4])
+
+    def test_update_name_in_schedule(self):
+        schedule = self.db.generate_schedule(3)
+        day = schedule[2][0]
+        old_name = schedule[2][1]
+        self.db.update_name({old_name: 'Z'})
+        self.db.c.execute('''SELECT name1, name2, name3 FROM schedule''')
+        for row in self.db.c.fetchall():
+            self.assertNotIn(old_name, row)
+        names = self.db.advance_schedule(day)
+        self.assertIn('Z', names)
+        active = [name[0] for name in self.db.get_active_names()]
+        self.assertIn('Z', active)
+        self.db.mark_name_as_prayed('Z')
+        self.db.c.execute('''SELECT prayedFor FROM nameTable WHERE name = 'Z' ''')
+        self.assertEqual(self.db.c.fetchone()[0], 'True')
+
+    def test_export_schedule(self):
+        schedule = self.db.generate_schedule(3)
+        export_file = os.path.join(os.getcwd(), 'test_schedule.csv')
+        self.db.export_schedule(export_file)
+        with open(export_file, encoding='UTF-8') as f:
+            rows = list(csv.reader(f))
+        os.remove(export_file)
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(rows[0][0], str(datetime.date.today()))
+        self.assertEqual(rows[2][1:], list(schedule[2][1:4]))
+
 
 if __name__ == '__main__':
     try: